@@ -9,20 +9,28 @@ Classes:
 """
 
 import argparse
-from dataclasses import dataclass, field
-from typing import List
+from array import array
+from dataclasses import dataclass
+import heapq
+import mmap
 import os
 import sys
 from maze_gen import MazeGenerator, MazeProperties
 
-@dataclass
+# Column and row offsets for each movement key.
+_MOVES = {'W': (0, -1), 'S': (0, 1), 'A': (-1, 0), 'D': (1, 0)}
+
+# ANSI sequence that erases the screen and moves the cursor to the top-left corner.
+_CLEAR_SCREEN = '\x1b[2J\x1b[H'
+
+@dataclass(slots=True)
 class Maze:
     """
     Holds the structure and player information of a maze.
 
     Attributes:
-        layout: A matrix representation of the maze where each cell can be a path, wall,
-                start, or exit.
+        layout: A flat, row-major string of the maze where each character is a cell that can
+                be a path, wall, start, or exit. The cell at (x, y) is at index y * width + x.
         width: The total number of columns in the maze.
         height: The total number of rows in the maze.
         start_x: The column index where the player starts.
@@ -30,7 +38,7 @@ class Maze:
         player_x: The current column index of the player within the maze.
         player_y: The current row index of the player within the maze.
     """
-    layout: List[List[str]] = field(default_factory=list)
+    layout: str = ''
     width: int = 0
     height: int = 0
     start_x: int = 0
@@ -47,6 +55,7 @@ class MazeGame:
         display_maze: Outputs the current state of the maze with the player's location.
         move_player: Updates the player's position based on input directions.
         check_win_condition: Determines if the player has reached the maze's exit.
+        solve: Finds the shortest path from the player's position to the exit.
         play: Launches the game, processing user input for navigation until the game concludes.
     """
 
@@ -73,33 +82,45 @@ class MazeGame:
         if os.path.getsize(filename) == 0:
             raise ValueError(f"The file '{filename}' is empty.")
 
-        with open(filename, 'r', encoding='utf-8') as file:
-            first_line = file.readline().strip()
-            try:
-                self.maze.height, self.maze.width = map(int, first_line.split())
-                layout_lines = file.readlines()
-            except ValueError:
-                layout_lines = [first_line] + file.readlines()
-                self.maze.height = len(layout_lines)
-                self.maze.width = len(layout_lines[0].rstrip())
-
-            self.maze.layout = [list(line.strip()) for line in layout_lines]
-            for y, line in enumerate(layout_lines):
-                if 'S' in line:
-                    self.maze.start_x, self.maze.start_y = line.index('S'), y
-                    self.maze.player_x, self.maze.player_y = self.maze.start_x, self.maze.start_y
+        with open(filename, 'rb') as file, \
+                mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            # Read line by line straight from the mapping instead of copying the whole file.
+            lines = [line.rstrip(b'\r\n').decode('utf-8') for line in iter(data.readline, b'')]
+
+        # Trailing blank lines are not part of the maze and must not become rows.
+        while lines and not lines[-1].strip():
+            lines.pop()
+        if not lines:
+            raise ValueError(f"The file '{filename}' is empty.")
+
+        try:
+            self.maze.height, self.maze.width = map(int, lines[0].split())
+            body = lines[1:self.maze.height + 1]
+        except ValueError:
+            body = lines
+            self.maze.height = len(body)
+            self.maze.width = len(body[0].rstrip())
+
+        width = self.maze.width
+        rows = [line.ljust(width)[:width] for line in body]
+        self.maze.layout = ''.join(rows)
+        # Rows joined with newlines, built once so each frame only splices in the player cell.
+        self._frame = '\n'.join(rows) + '\n'
+
+        start = self.maze.layout.find('S')
+        if start != -1:
+            self.maze.start_y, self.maze.start_x = divmod(start, width)
+            self.maze.player_x, self.maze.player_y = self.maze.start_x, self.maze.start_y
 
     def display_maze(self):
         """
         Displays the maze with the player's current location marked distinctly.
         """
-        for y, row in enumerate(self.maze.layout):
-            for x, char in enumerate(row):
-                if x == self.maze.player_x and y == self.maze.player_y:
-                    print('X', end='')
-                else:
-                    print(char, end='')
-            print()
+        frame = self._frame
+        # Each row in the cached frame is followed by a newline, hence the width + 1 stride.
+        player = self.maze.player_y * (self.maze.width + 1) + self.maze.player_x
+        sys.stdout.write(frame[:player] + 'X' + frame[player + 1:])
+        sys.stdout.flush()
 
     def move_player(self, direction: str) -> str:
         """
@@ -111,21 +132,14 @@ class MazeGame:
         Returns:
             A message indicating the move's result, or None if successful.
         """
-        dx, dy = 0, 0
-        if direction.upper() == 'W':
-            dy = -1
-        elif direction.upper() == 'S':
-            dy = 1
-        elif direction.upper() == 'A':
-            dx = -1
-        elif direction.upper() == 'D':
-            dx = 1
-        else:
-            return
+        offset = _MOVES.get(direction.upper())
+        if offset is None:
+            return None
+        dx, dy = offset
 
         new_x, new_y = self.maze.player_x + dx, self.maze.player_y + dy
         if 0 <= new_x < self.maze.width and 0 <= new_y < self.maze.height:
-            if self.maze.layout[new_y][new_x] != '#':
+            if self.maze.layout[new_y * self.maze.width + new_x] != '#':
                 self.maze.player_x, self.maze.player_y = new_x, new_y
                 return None
             return "Invalid move: you can't move through walls."
@@ -138,13 +152,84 @@ class MazeGame:
         Returns:
             True if the player's current position is the exit, False otherwise.
         """
-        return self.maze.layout[self.maze.player_y][self.maze.player_x] == 'E'
+        player = self.maze.player_y * self.maze.width + self.maze.player_x
+        return self.maze.layout[player] == 'E'
+
+    def solve(self) -> list[tuple[int, int]] | None:
+        """
+        Finds the shortest path from the player's position to the exit using A* search
+        with a Manhattan distance heuristic.
+
+        Returns:
+            The (x, y) cells from the player's position to the exit, both inclusive, or
+            None if the exit cannot be reached.
+        """
+        layout, width, height = self.maze.layout, self.maze.width, self.maze.height
+        goal = layout.find('E')
+        if goal == -1:
+            return None
+        goal_y, goal_x = divmod(goal, width)
+        wall = '#'
+
+        start = self.maze.player_y * width + self.maze.player_x
+        closed = bytearray(width * height)
+        cost = array('i', [-1]) * (width * height)
+        parent = array('i', [-1]) * (width * height)
+        cost[start] = 0
+        open_cells = [(abs(goal_x - self.maze.player_x) + abs(goal_y - self.maze.player_y),
+                       0, start)]
+
+        while open_cells:
+            _, steps, cell = heapq.heappop(open_cells)
+            if closed[cell]:
+                continue
+            if cell == goal:
+                path = []
+                while cell != -1:
+                    y, x = divmod(cell, width)
+                    path.append((x, y))
+                    cell = parent[cell]
+                return path[::-1]
+            closed[cell] = 1
+
+            y, x = divmod(cell, width)
+            for dx, dy in _MOVES.values():
+                nx, ny = x + dx, y + dy
+                if not (0 <= nx < width and 0 <= ny < height):
+                    continue
+                neighbour = ny * width + nx
+                if closed[neighbour] or layout[neighbour] == wall:
+                    continue
+                if cost[neighbour] == -1 or steps + 1 < cost[neighbour]:
+                    cost[neighbour] = steps + 1
+                    parent[neighbour] = cell
+                    estimate = steps + 1 + abs(goal_x - nx) + abs(goal_y - ny)
+                    heapq.heappush(open_cells, (estimate, steps + 1, neighbour))
+        return None
+
+    def _hint(self) -> str:
+        """
+        Suggests the next move towards the exit.
+
+        Returns:
+            A message naming the direction to move in.
+        """
+        path = self.solve()
+        if not path:
+            return "Hint: the exit cannot be reached from here."
+        if len(path) == 1:
+            return "Hint: you are already at the exit."
+        (x, y), (next_x, next_y) = path[0], path[1]
+        offset = (next_x - x, next_y - y)
+        direction = next(key for key, move in _MOVES.items() if move == offset)
+        return f"Hint: move {direction} ({len(path) - 1} steps to the exit)."
 
     def _clear_terminal(self):
         """
         Clears the console screen to refresh the game's visual presentation.
         """
-        os.system('cls' if os.name == 'nt' else 'clear')
+        sys.stdout.write(_CLEAR_SCREEN)
+        sys.stdout.flush()
 
     def play(self, refresh: bool = False):
         """
@@ -153,26 +238,30 @@ class MazeGame:
         Args:
             refresh: Whether to clear the screen after each move to keep the display uncluttered.
         """
+        if os.name == 'nt':
+            # Running an empty command enables ANSI escape processing in the Windows console.
+            os.system('')
         self._clear_terminal()
-        print(f"Welcome to the Maze Game! (W, A, S, D to move." \
+        print(f"Welcome to the Maze Game! (W, A, S, D to move. H for Hint." \
               f"{" M for Map" if not refresh else ""})")
         self.display_maze()
 
         while not self.check_win_condition():
-            move = input(f"Next move (W/A/S/D/{'M/' if not refresh else ''}Q): ").strip()
+            move = input(f"Next move (W/A/S/D/H/{'M/' if not refresh else ''}Q): ").strip().upper()
 
             top_msg = ''
 
-            if move.upper() == 'M' and not refresh:
+            if move == 'M' and not refresh:
                 self.display_maze()
-            elif move.upper() == 'Q':
+            elif move == 'Q':
                 print("Quitting game.")
                 return
-            elif move.upper() not in ('W', 'A', 'S', 'D', 'M', 'Q'):
-                top_msg = "Invalid input: please use W, A, S, D, M, or Q."
-
-            if move.upper() in ('W', 'A', 'S', 'D'):
+            elif move == 'H':
+                top_msg = self._hint()
+            elif move in _MOVES:
                 top_msg = self.move_player(move)
+            elif move != 'M':
+                top_msg = "Invalid input: please use W, A, S, D, H, M, or Q."
 
             if refresh:
                 self._clear_terminal()
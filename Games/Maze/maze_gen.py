@@ -6,10 +6,93 @@ for walls, paths, start, and end points. It includes capabilities to print the m
 to the console and write it to a specified file.
 """
 
+from array import array
 from dataclasses import dataclass
 import argparse
+import functools
 import random
 
+# Cell codes stored in the generator's grid; translated to the configured
+# characters only when the maze is printed or written out.
+_WALL, _PATH, _START, _END = range(4)
+
+# Offsets to the cells two steps away in each direction.
+_DIRS = ((-2, 0), (0, 2), (2, 0), (0, -2))
+
+def _get_neighbours(maze: bytearray, size: int, cell: int, visited: bytearray) -> list[int]:
+    """
+    Find unvisited neighbours of a cell in the maze.
+
+    Parameters:
+        maze (bytearray): Flat, row-major grid of cell codes.
+        size (int): The width and height of the grid.
+        cell (int): Flat index (x * size + y) of the current cell.
+        visited (bytearray): Flat, row-major flags marking visited cells.
+
+    Returns:
+        list[int]: Flat indices of unvisited neighbours.
+    """
+    x, y = divmod(cell, size)
+    neighbors = []
+    for dx, dy in _DIRS:
+        nx, ny = x + dx, y + dy
+        if 0 <= nx < size and 0 <= ny < size:
+            neighbor = nx * size + ny
+            if not visited[neighbor] and maze[neighbor] == _WALL:
+                neighbors.append(neighbor)
+    return neighbors
+
+def _carve(size: int, seed: int | None) -> bytes:
+    """
+    Carve a square maze using the Randomized Prim's algorithm.
+
+    Parameters:
+        size (int): The width and height of the maze. Must be odd.
+        seed (int | None): Seed for the random generator, or None to use the global one.
+
+    Returns:
+        bytes: Flat, row-major grid of cell codes.
+    """
+    randrange = random.randrange if seed is None else random.Random(seed).randrange
+    maze = bytearray(size * size)
+
+    # Every cell is pushed at most once, so the stack never outgrows the grid.
+    stack = array('i', [0]) * (size * size)
+    top = 0
+    visited = bytearray(size * size)
+
+    start = 1
+    maze[start] = _START
+    stack[top] = start + size
+    top += 1
+    visited[start + size] = 1
+
+    while top:
+        current = stack[top - 1]
+        maze[current] = _PATH
+        neighbours = _get_neighbours(maze, size, current, visited)
+
+        if neighbours:
+            count = len(neighbours)
+            next_cell = neighbours[randrange(count)] if count > 1 else neighbours[0]
+            visited[next_cell] = 1
+            # Neighbours are two cells apart, so the wall between them sits at the midpoint.
+            maze[(current + next_cell) // 2] = _PATH
+            stack[top] = next_cell
+            top += 1
+        else:
+            top -= 1
+
+    for x in range(size-2, 0, -1):
+        if maze[(size-2) * size + x] == _PATH:
+            maze[(size-1) * size + x] = _END
+            break
+
+    return bytes(maze)
+
+# Seeded mazes are reproducible, so regenerating one is served from this cache.
+_carve_seeded = functools.lru_cache(maxsize=32)(_carve)
+
 @dataclass
 class MazeProperties:
     """
@@ -21,12 +104,14 @@ class MazeProperties:
         path_char (str): Character used to represent paths. Defaults to ' '.
         start_char (str): Character used to represent the start point. Defaults to 'S'.
         end_char (str): Character used to represent the end point. Defaults to 'E'.
+        seed (int | None): Seed for reproducible mazes. Defaults to None (random).
     """
     size: int = 10
     wall_char: str = '#'
     path_char: str = ' '
     start_char: str = 'S'
     end_char: str = 'E'
+    seed: int | None = None
 
 class MazeGenerator:
     """
@@ -46,74 +131,44 @@ class MazeGenerator:
             properties (MazeProperties): The properties of the maze.
         """
         self.properties = properties
-        self.maze = []
+        self.maze = bytearray()
         if self.properties.size not in range(4, 101):
             raise ValueError("Maze size must be in range 5 and 100.")
 
-    def _get_neighbours(self, x: int, y: int, visited: set) -> list[tuple[int, int]]:
+    def generate_maze(self):
         """
-        Find unvisited neighbours of a cell in the maze.
-
-        Parameters:
-            x, y (int): Coordinates of the current cell.
-            visited (set): Set of visited cells.
+        Generate a square maze using the Randomized Prim's algorithm.
 
-        Returns:
-            list[tuple[int, int]]: Coordinates for unvisited neighbours.
+        Mazes generated with a seed are reproducible and cached.
         """
-        directions = [(-2, 0), (0, 2), (2, 0), (0, -2)]
-        neighbors = []
-        for dx, dy in directions:
-            nx, ny = x + dx, y + dy
-            if (0 <= nx < self.properties.size
-                and 0 <= ny < self.properties.size
-                and (nx, ny) not in visited
-                and self.maze[nx][ny] == self.properties.wall_char):
-                neighbors.append((nx, ny))
-        return neighbors
+        self.properties.size = max(5, min(self.properties.size | 1, 99))
+        size, seed = self.properties.size, self.properties.seed
+        grid = _carve(size, seed) if seed is None else _carve_seeded(size, seed)
+        self.maze = bytearray(grid)
 
-    def generate_maze(self):
+    def _rows(self) -> list[str]:
         """
-        Generate a square maze using the Randomized Prim's algorithm.
+        Translate the grid's cell codes into rows of the configured characters.
+
+        Returns:
+            list[str]: The rows of the maze, top to bottom.
         """
-        self.properties.size = max(5, min(self.properties.size | 1, 99))
-        self.maze = [[self.properties.wall_char for _ in range(self.properties.size)]
-                     for _ in range(self.properties.size)]
-
-        stack = []
-        visited = set()
-
-        start = (0, 1)
-        self.maze[start[0]][start[1]] = self.properties.start_char
-        stack.append((start[0]+1, start[1]))
-        visited.add((start[0]+1, start[1]))
-
-        while stack:
-            current = stack[-1]
-            x, y = current
-            self.maze[x][y] = self.properties.path_char
-            neighbours = self._get_neighbours(x, y, visited)
-
-            if neighbours:
-                next_cell = random.choice(neighbours)
-                visited.add(next_cell)
-                wall_x, wall_y = (x + next_cell[0]) // 2, (y + next_cell[1]) // 2
-                self.maze[wall_x][wall_y] = self.properties.path_char
-                stack.append(next_cell)
-            else:
-                stack.pop()
-
-        for x in range(self.properties.size-2, 0, -1):
-            if self.maze[self.properties.size-2][x] == self.properties.path_char:
-                self.maze[self.properties.size-1][x] = self.properties.end_char
-                break
+        size = self.properties.size
+        table = {
+            _WALL: self.properties.wall_char,
+            _PATH: self.properties.path_char,
+            _START: self.properties.start_char,
+            _END: self.properties.end_char,
+        }
+        # Split before translating, since a configured character may be several long.
+        return [self.maze[i:i + size].decode('latin-1').translate(table)
+                for i in range(0, size * size, size)]
 
     def print_maze(self):
         """
         Print the maze to the console.
         """
-        for row in self.maze:
-            print(''.join(row))
+        print('\n'.join(self._rows()))
 
     def write_to_file(self, filename:str="maze.txt"):
         """
@@ -127,8 +182,7 @@ class MazeGenerator:
         """
         try:
             with open(filename, "w", encoding="utf-8") as file:
-                for row in self.maze:
-                    file.write(''.join(row) + "\n")
+                file.write('\n'.join(self._rows()) + "\n")
         except IOError as e:
             print(f"Error writing to file {filename}: {e}")
 
@@ -148,13 +202,15 @@ if __name__ == '__main__':
                         help='Character to represent the start point.')
     parser.add_argument('--end', default='E',
                         help='Character to represent the end point.')
+    parser.add_argument('--seed', type=int, default=None,
+                        help='Seed for the random generator, for reproducible mazes.')
     parser.add_argument('--print', action='store_true',
                         help='Print the maze to the console.')
 
     args = parser.parse_args()
     maze_properties = MazeProperties(size=args.size, wall_char=args.wall,
                                      path_char=args.path, start_char=args.start,
-                                     end_char=args.end)
+                                     end_char=args.end, seed=args.seed)
     maze = MazeGenerator(maze_properties)
     maze.generate_maze()
 
@@ -0,0 +1,32 @@
+"""
+Tests for the maze_gen module.
+"""
+
+import unittest
+
+from maze_gen import MazeGenerator, MazeProperties
+
+
+class MazeGeneratorRowsTest(unittest.TestCase):
+    """
+    Checks that generated mazes are rendered one grid row per output row.
+    """
+
+    def test_multi_character_glyphs(self):
+        """
+        Multi-character wall and path glyphs keep every row aligned with the grid.
+        """
+        plain = MazeGenerator(MazeProperties(size=11, seed=7))
+        plain.generate_maze()
+        wide = MazeGenerator(MazeProperties(size=11, seed=7, wall_char='##', path_char='  '))
+        wide.generate_maze()
+
+        plain_rows, wide_rows = plain._rows(), wide._rows()
+        self.assertEqual(len(wide_rows), 11)
+        for plain_row, wide_row in zip(plain_rows, wide_rows):
+            expected = plain_row.replace('#', '##').replace(' ', '  ')
+            self.assertEqual(wide_row, expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -4,26 +4,41 @@ This module implements the Caesar Cipher encryption and decryption algorithm.
 """
 
 import argparse
-import string
+import functools
 
 
-class CaesarCipher:
+@functools.lru_cache(maxsize=64)
+def _make_table(key: int, enc: bool) -> dict[int, int]:
     """
-    This class implements the Caesar Cipher encryption and decryption algorithm.
+    Builds the translation table for a given key and direction.
+
+    Tables are cached so repeated calls with the same key skip rebuilding them.
+
+    Args:
+        key (int): The encryption or decryption key.
+        enc (bool): Whether to build an encryption (True) or decryption (False) table.
+
+    Returns:
+        dict[int, int]: A table suitable for `str.translate`.
     """
+    shift = (key if enc else -key) % 26
+    return {base + idx: base + (idx + shift) % 26
+            for base in (ord('A'), ord('a')) for idx in range(26)}
 
-    def __init__(self) -> None:
-        """
-        Initializes the Caesar_Cipher object.
 
-        The `chars` attribute is a list of uppercase letters of the English alphabet.
-        """
-        self.chars = list(string.ascii_uppercase)
+class CaesarCipher:
+    """
+    This class implements the Caesar Cipher encryption and decryption algorithm.
+    """
 
     def __perform_caesar(self, text: str, key: int, enc: bool) -> str:
         """
         Performs the Caesar Cipher encryption or decryption on the given text.
 
+        The whole text is shifted in a single pass by `str.translate`, mapping each
+        ASCII letter onto its rotated counterpart and leaving everything else untouched.
+        The translation table is cached per key and direction.
+
         Args:
             text (str): The text to be encrypted or decrypted.
             key (int): The encryption or decryption key.
@@ -32,32 +47,7 @@ class CaesarCipher:
         Returns:
             str: The encrypted or decrypted text.
         """
-        decrypted_text = ""
-
-        for char in text:
-            if char.upper() in self.chars:
-                decrypted_char = self.__rotate(char, key, enc)
-                decrypted_text += decrypted_char if char.isupper() else decrypted_char.lower()
-            else:
-                decrypted_text += char
-
-        return decrypted_text
-
-    def __rotate(self, char: str, key: int, forward: bool) -> str:
-        """
-        Rotates the given character by the specified key.
-
-        Args:
-            char (str): The character to be rotated.
-            key (int): The rotation key.
-            forward (bool): A flag indicating whether to rotate forward (True) or backward (False).
-
-        Returns:
-            str: The rotated character.
-        """
-        action = lambda a, b, c: a + b if c else a - b
-        idx = action(self.chars.index(char.upper()), key, forward)
-        return self.chars[idx % len(self.chars)]
+        return text.translate(_make_table(key, enc))
 
     def encrypt(self, text: str, key: int) -> str:
         """
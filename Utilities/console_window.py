@@ -2,11 +2,73 @@
 This module provides the ConsoleWindow class, a curses-based console window interface
 for creating applications with dynamic, scrollable content and a status bar. It's designed
 for terminal applications that require real-time data display and user interactions.
+
+It uses the standard library curses module; on Windows, install the windows-curses package.
+Lines are trimmed by display width so they never wrap; the optional wcwidth package is used
+to measure characters when installed.
 """
 
+import curses
 import threading
 import time
-import unicurses as uc
+import unicodedata
+from collections import deque
+from itertools import islice
+
+try:
+    from wcwidth import wcwidth
+except ImportError:
+    wcwidth = None
+
+# Minimum time between redraws, and how often input is polled while idle (~30 Hz).
+REDRAW_INTERVAL_MS = 33
+# Number of lines kept when no buffer size is given.
+DEFAULT_MAX_HISTORY = 10_000
+# Height of the content pad in screens; scrolling outside it rebuilds the pad from content.
+PAD_SCREENS = 4
+
+
+def _char_width(char: str) -> int:
+    """
+    Returns the number of terminal columns a printable character occupies.
+
+    Args:
+        char (str): A single printable character.
+
+    Returns:
+        int: 0 for combining characters, 2 for wide ones and 1 otherwise.
+    """
+    if wcwidth is not None:
+        return max(wcwidth(char), 0)
+    if unicodedata.combining(char):
+        return 0
+    return 2 if unicodedata.east_asian_width(char) in 'WF' else 1
+
+
+def _trim(text: str, width: int) -> str:
+    """
+    Cuts text down to a single row of at most width terminal columns.
+
+    Tabs are expanded and any other unprintable character, such as a newline, is shown as
+    a space, so the result never wraps or moves the cursor to another row.
+
+    Args:
+        text (str): The line to trim.
+        width (int): The number of columns available.
+
+    Returns:
+        str: The longest prefix of the cleaned text that fits in width columns.
+    """
+    if not text.isprintable():
+        text = ''.join(char if char.isprintable() else ' ' for char in text.expandtabs())
+    if text.isascii():
+        return text[:width]
+    columns = 0
+    for index, char in enumerate(text):
+        columns += _char_width(char)
+        if columns > width:
+            return text[:index]
+    return text
 
 
 class ConsoleWindow:
@@ -15,49 +77,112 @@ class ConsoleWindow:
     and a status bar, leveraging curses for real-time data display and user interactions.
     Designed for terminal applications needing dynamic content updates and interactions.
 
-    Please note, resizing the terminal window can cause display issues.
-
     Attributes:
-        stdscr: The standard screen object from unicurses used for the interface.
-        content: A list of strings representing the content to be displayed.
+        stdscr: The standard screen object from curses used for the interface.
+        content: A deque of strings representing the content to be displayed, bounded by
+                 buffer_size.
+        pad: A curses pad holding a few screens of trimmed content around the visible
+             part, which is blitted to the screen at the current scroll position.
         scroll_position: An integer tracking the current scroll position.
-        background_thread: A threading.Thread object for running background tasks.
+        num_workers: The number of threads run() starts on worker_task. Defaults to 1.
+        title_text: A string representing the current title text.
         status_text: A string representing the current status text.
         quit_message: A string displayed to indicate how to quit the application.
-        buffer_size: An optional integer specifying the max number of lines in content.
+        buffer_size: An integer specifying the max number of lines in content.
+        max_history: The number of lines kept when no buffer size is given.
     """
 
-    def __init__(self, buffer_size=None):
+    num_workers = 1
+
+    def __init__(self, buffer_size=None, max_history=DEFAULT_MAX_HISTORY):
         """
         Initializes the console window with an optional buffer size.
         Args:
             buffer_size (int or str, optional): Maximum number of lines to keep in the content.
-                                                 If 'auto', adjusts buffer to content area size.
-                                                 If None, the content is not limited.
+                                                 If 'auto', grows with the content area size.
+                                                 If None, keeps max_history lines.
+            max_history (int, optional): Lines of history to keep when buffer_size is None.
+                                         Bounds memory use for long-running windows.
         """
-        self.stdscr = uc.initscr()
-        self.content = []
+        self.max_history = max_history
+        self.auto_buffer = buffer_size == 'auto'
+        self.buffer_size = None if self.auto_buffer else buffer_size or max_history
+        if self.buffer_size is not None and self.buffer_size < 1:
+            raise ValueError("buffer_size and max_history must be at least 1.")
+        self.stdscr = curses.initscr()
+        self.content = deque(maxlen=self.buffer_size)
+        self._pending = deque(maxlen=self.buffer_size)
         self.scroll_position = 0
-        self.background_thread = threading.Thread(target=self.worker_task, daemon=True)
+        # Number of lines ever posted; content[0] is line number _total - len(content).
+        self._total = 0
+        self._threads = []
+        self._running = False
+        # Set by producers after posting, so the event loop redraws without waiting for input.
+        self._wake = threading.Event()
+        self._dirty = False
+        self.title_text = ""
         self.status_text = "Status: Initializing"
         self.quit_message = "Press Q to quit"
-        self.auto_buffer = buffer_size == 'auto'
-        self.buffer_size = None if self.auto_buffer else buffer_size
+        # The status text currently painted, or None when the status bar must be repainted.
+        self._drawn_status = None
+        # Guards content, pending lines and scroll_position; never held across curses calls.
+        self._lock = threading.Lock()
+        self._last_draw = 0.0
+        self._ui_thread = threading.current_thread()
         self.__init_ui()
 
     def __init_ui(self):
         """Initializes UI components like window dimensions and input modes."""
-        uc.start_color()
-        uc.init_pair(1, uc.COLOR_WHITE, uc.COLOR_BLUE)
-        uc.clear()
-        self.height, self.width = uc.getmaxyx(self.stdscr)
-        uc.noecho()
-        uc.cbreak()
-        uc.keypad(self.stdscr, True)
-        uc.mousemask(uc.ALL_MOUSE_EVENTS)
+        curses.start_color()
+        curses.init_pair(1, curses.COLOR_WHITE, curses.COLOR_BLUE)
+        # Bar attributes are constant once the pair exists; look them up once.
+        self._attr_normal = curses.color_pair(1)
+        self._attr_bold = self._attr_normal | curses.A_BOLD
+        self._bar_fill = ord(' ') | self._attr_normal
+        self.stdscr.clear()
+        self.height, self.width = self.stdscr.getmaxyx()
+        curses.noecho()
+        curses.cbreak()
+        self.stdscr.keypad(True)
+        curses.mousemask(curses.ALL_MOUSE_EVENTS)
+        self._key_handlers = {
+            ord('q'): self._quit,
+            ord('Q'): self._quit,
+            curses.KEY_MOUSE: self._on_mouse,
+            curses.KEY_UP: self.__scroll_content_up,
+            curses.KEY_DOWN: self.__scroll_content_down,
+            curses.KEY_RESIZE: self.__on_resize,
+        }
         self.__setup_display_areas()
         if self.auto_buffer:
-            self.buffer_size = self.displayable_content_lines
+            self.__fit_auto_buffer()
+        self.__create_pad()
+        self._flush()
+
+    def __fit_auto_buffer(self):
+        """
+        Grows an 'auto' buffer to the content area; needs the lock once workers run.
+
+        The buffer is never shrunk, so briefly making the terminal smaller keeps the history.
+        """
+        size = max(self._display_lines, 1)
+        if self.buffer_size is not None and size <= self.buffer_size:
+            return
+        self.buffer_size = size
+        self.content = deque(self.content, maxlen=self.buffer_size)
+        self._pending = deque(self._pending, maxlen=self.buffer_size)
+
+    def __create_pad(self):
+        """Creates an empty content pad sized for the content area and the current width."""
+        self._pad_height = PAD_SCREENS * max(self._display_lines, 1)
+        # One spare column keeps full-width lines from wrapping onto the next pad row.
+        self.pad = curses.newpad(self._pad_height, self.width + 1)
+        self.pad.scrollok(True)
+        # Pad row 0 holds line number _pad_first; the next redraw refills an empty pad.
+        self._pad_first = 0
+        self._pad_lines = 0
+        # Pad row shown at the top of the last blit, or None when the pad has not been shown.
+        self._drawn_scroll = None
 
     def __setup_display_areas(self):
         """Configures display areas for content and the status bar."""
@@ -65,14 +190,30 @@ class ConsoleWindow:
         self.status_row = self.height - 1
         self.content_start_row = 1
         self.content_end_row = self.status_row - 1
-        uc.refresh()
-        if self.auto_buffer:
-            self.buffer_size = self.displayable_content_lines
+        self._display_lines = self.content_end_row - self.content_start_row + 1
+        self.__draw_quit_message()
+        self.stdscr.noutrefresh()
+
+    @property
+    def quit_message(self):
+        """The message shown at the right end of the status bar."""
+        return self._quit_message
+
+    @quit_message.setter
+    def quit_message(self, message: str):
+        self._quit_message = message
+        # Repainted, and its position recomputed, on the next status bar draw.
+        self._quit_msg_pos = None
+        self.__request_redraw()
 
     @property
     def displayable_content_lines(self):
-        """Calculates displayable lines in the content area."""
-        return self.content_end_row - self.content_start_row + 1
+        """Number of displayable lines in the content area."""
+        return self._display_lines
+
+    def _flush(self):
+        """Pushes every window update staged with wnoutrefresh to the terminal at once."""
+        curses.doupdate()
 
     def set_title(self, title: str):
         """
@@ -81,92 +222,290 @@ class ConsoleWindow:
         Args:
             title (str): The title text to be displayed.
         """
-        uc.move(self.title_row, 0)
-        uc.clrtoeol()
-        uc.mvaddstr(self.title_row, 0, " " * self.width, uc.color_pair(1))
+        self.title_text = title
+        self.__draw_title()
+        self.stdscr.noutrefresh()
+        self._flush()
+
+    def __draw_title(self):
+        """Draws the title bar into the standard screen without refreshing it."""
+        self.stdscr.hline(self.title_row, 0, self._bar_fill, self.width)
+        title = _trim(self.title_text, self.width)
         title_position = (self.width - len(title)) // 2
-        uc.mvaddstr(self.title_row, title_position, title,
-                    uc.color_pair(1) | uc.A_BOLD)
-        uc.refresh()
+        self.stdscr.insstr(self.title_row, title_position, title, self._attr_bold)
 
     def add_content(self, message: str):
         """
         Appends a message to the content, maintaining or adjusting buffer size if specified.
+        The content area is redrawn by the event loop, at most once per redraw interval.
         Args:
             message (str): Text to add to the content area.
         """
-        if self.buffer_size is not None and len(self.content) >= self.buffer_size:
-            self.content.pop(0)
-        self.content.append(message)
-        self.__adjust_scroll_for_new_content()
-        self.__update_content_window()
+        self.post((message,))
+
+    def post(self, messages):
+        """
+        Appends several messages to the content at once.
+
+        The messages are added under a single lock acquisition and the scroll position is
+        adjusted once, so a burst of output costs the same single redraw as one line.
+        Args:
+            messages (Iterable[str]): Lines to add to the content area, oldest first.
+        """
+        messages = list(messages)
+        with self._lock:
+            self.content.extend(messages)
+            self._total += len(messages)
+            # Trimmed under the lock so a concurrent resize cannot leave lines of the old width.
+            self._pending.extend(_trim(message, self.width) for message in messages)
+            self.__adjust_scroll_for_new_content()
+        self.__request_redraw()
+
+    def __request_redraw(self):
+        """Marks the window for a redraw and wakes the event loop to perform it."""
+        self._dirty = True
+        self._wake.set()
+
+    def __max_scroll(self):
+        """Returns the scroll position that shows the newest line last; needs the lock."""
+        return max(0, len(self.content) - self._display_lines)
 
     def __adjust_scroll_for_new_content(self):
         """Adjusts the scroll position for new content, if necessary."""
-        if len(self.content) > self.displayable_content_lines:
-            self.scroll_position = len(self.content) - self.displayable_content_lines
+        self.scroll_position = self.__max_scroll()
 
     def set_status(self, status: str):
         """
-        Updates the status bar text.
+        Updates the status bar text. When called from a background thread, the status
+        bar is redrawn by the event loop instead, so curses is only driven from one thread.
 
         Args:
             status (str): New status message.
         """
-        uc.move(self.status_row, 0)
-        uc.clrtoeol()
-        uc.mvaddstr(self.status_row, 0, " " * self.width, uc.color_pair(1))
-        uc.mvaddstr(self.status_row, 0, status, uc.color_pair(1) | uc.A_BOLD)
-        quit_msg_pos = self.width - len(self.quit_message)
-        uc.mvaddstr(self.status_row, quit_msg_pos, self.quit_message,
-                    uc.color_pair(1) | uc.A_BOLD)
-        uc.refresh()
+        self.status_text = status
+        if status == self._drawn_status:
+            return
+        if threading.current_thread() is not self._ui_thread:
+            self.__request_redraw()
+            return
+        self.__draw_status()
+        self.stdscr.noutrefresh()
+        self._flush()
+
+    def __draw_quit_message(self):
+        """Paints the whole status bar background and the quit message at its right end."""
+        self._quit_msg_pos = max(0, self.width - len(self._quit_message))
+        self._drawn_status = None
+        self.stdscr.hline(self.status_row, 0, self._bar_fill, self.width)
+        # insstr never advances the cursor or wraps, so filling the bottom-right cell does not
+        # fail and a message wider than the terminal is cut off at its right edge.
+        self.stdscr.insstr(self.status_row, self._quit_msg_pos, self._quit_message,
+                           self._attr_bold)
+
+    def __draw_status(self):
+        """
+        Draws the status text into the standard screen without refreshing it.
+
+        Only the part of the bar left of the quit message is rewritten; the quit message
+        itself is painted once and only repainted when it changes.
+        """
+        if self._quit_msg_pos is None:
+            self.__draw_quit_message()
+        self.stdscr.hline(self.status_row, 0, self._bar_fill, self._quit_msg_pos)
+        status = self.status_text
+        # addstr fails on the bottom-right cell, so the last column is never written here.
+        room = min(self._quit_msg_pos, self.width - 1)
+        self.stdscr.addstr(self.status_row, 0, _trim(status, room), self._attr_bold)
+        self._drawn_status = status
+
+    def __append_to_pad(self, lines):
+        """
+        Appends lines added since the last redraw to the bottom of the pad.
+
+        When the pad is full it is scrolled once for the whole batch, so existing rows are
+        shifted once per redraw instead of once per line; only the new rows are written,
+        each at its own row so pad row i always holds line number _pad_first + i.
+
+        Args:
+            lines (Collection[str]): The new lines, oldest first, already trimmed to the width.
+        """
+        if not lines:
+            return
+        skipped = len(lines) - self._pad_height
+        if skipped > 0:
+            # The batch alone overfills the pad; only its newest lines are kept.
+            lines = list(islice(lines, skipped, None))
+            self.pad.erase()
+            self._pad_first += self._pad_lines + skipped
+            self._pad_lines = 0
+        overflow = self._pad_lines + len(lines) - self._pad_height
+        if overflow > 0:
+            self.pad.scroll(overflow)
+            self._pad_first += overflow
+            self._pad_lines -= overflow
+        for row, line in enumerate(lines, self._pad_lines):
+            self.pad.addnstr(row, 0, line, self.width)
+        self._pad_lines += len(lines)
 
     def __update_content_window(self):
         """Redraws the content area with current content and scroll position."""
-        uc.move(self.content_start_row, 0)
-        uc.clrtobot()
-        content_to_display = self.content[self.scroll_position:
-                                          self.scroll_position + self.displayable_content_lines]
-        for i, line in enumerate(content_to_display):
-            uc.mvaddstr(self.content_start_row + i, 0, line[:self.width])
-        self.set_status(self.status_text)
-        uc.refresh()
+        self._dirty = False
+        self._last_draw = time.monotonic()
+        # The status bar is on its own row; only repaint it when its text has changed.
+        if self._quit_msg_pos is None or self.status_text != self._drawn_status:
+            self.__draw_status()
+            self.stdscr.noutrefresh()
+        # Too small to show any content; the next resize rebuilds the pad from content.
+        if self._display_lines <= 0:
+            self._flush()
+            return
+        rows = None
+        with self._lock:
+            # Swapping in an empty deque hands over the batch without copying it.
+            lines, self._pending = self._pending, deque(maxlen=self.buffer_size)
+            total = self._total
+            oldest = total - len(self.content)
+            top = oldest + self.scroll_position
+            bottom = min(top + self._display_lines, total)
+            # New lines can only be appended if they directly follow the pad's last row.
+            appendable = self._pad_first + self._pad_lines == total - len(lines)
+            if appendable:
+                pad_first, pad_end = max(self._pad_first, total - self._pad_height), total
+            else:
+                pad_first, pad_end = self._pad_first, self._pad_first + self._pad_lines
+            if not pad_first <= top <= bottom <= pad_end:
+                # The view left the pad: refill it with the content around the view.
+                margin = (self._pad_height - self._display_lines) // 2
+                start = max(0, min(self.scroll_position - margin,
+                                   len(self.content) - self._pad_height))
+                rows = [_trim(message, self.width) for message in
+                        islice(self.content, start, start + self._pad_height)]
+                pad_first = oldest + start
+        if rows is not None:
+            self.pad.erase()
+            self._pad_first, self._pad_lines = pad_first, 0
+            self.__append_to_pad(rows)
+        elif appendable:
+            self.__append_to_pad(lines)
+        pad_row = top - self._pad_first
+        # Status-only redraws leave every content row as it is; skip copying the pad.
+        if rows is not None or (appendable and lines) or pad_row != self._drawn_scroll:
+            self.pad.noutrefresh(pad_row, 0, self.content_start_row, 0,
+                                 self.content_end_row, self.width - 1)
+            self._drawn_scroll = pad_row
+        self._flush()
+
+    def __on_resize(self):
+        """
+        Adapts the layout to a new terminal size.
+
+        The dimensions are re-read and the pad is recreated empty, so the next redraw
+        refills it from the content at the new width and repaints the whole screen.
+        """
+        curses.endwin()
+        self.stdscr.refresh()
+        height, width = self.stdscr.getmaxyx()
+        with self._lock:
+            self.height, self.width = height, width
+            self._pending.clear()
+            # A view following the newest line keeps following it at the new height.
+            at_bottom = self.scroll_position >= self.__max_scroll()
+        self.__setup_display_areas()
+        with self._lock:
+            if self.auto_buffer:
+                self.__fit_auto_buffer()
+            max_scroll = self.__max_scroll()
+            self.scroll_position = max_scroll if at_bottom else min(self.scroll_position,
+                                                                    max_scroll)
+        self.__create_pad()
+        self.__draw_title()
+        self.stdscr.clearok(True)
+        self._dirty = True
+        self._last_draw = 0.0
 
     def __scroll_content_up(self):
         """Scrolls content up by one line, if possible."""
-        if self.scroll_position > 0:
-            self.scroll_position -= 1
-            self.__update_content_window()
+        with self._lock:
+            if self.scroll_position > 0:
+                self.scroll_position -= 1
+                self._dirty = True
 
     def __scroll_content_down(self):
         """Scrolls content down by one line if more content is available."""
-        if self.scroll_position < len(self.content) - self.displayable_content_lines:
-            self.scroll_position += 1
-            self.__update_content_window()
+        with self._lock:
+            if self.scroll_position < self.__max_scroll():
+                self.scroll_position += 1
+                self._dirty = True
 
     def worker_task(self):
         """
         Background task for dynamic content updates. Must be overridden in subclasses.
+
+        run() starts num_workers threads on this method. Workers should only share the
+        window through add_content, post and set_status, which are safe to call from any
+        thread; any other state shared between workers needs its own locking.
         """
         raise NotImplementedError("Override worker_task in a subclass.")
 
+    def _start_workers(self, n=1):
+        """
+        Starts fresh daemon threads running worker_task.
+
+        Threads are created here rather than in __init__, so run() can be called again
+        once an earlier run has returned.
+
+        Args:
+            n (int, optional): Number of worker threads to start.
+        """
+        self._threads = [threading.Thread(target=self.worker_task, daemon=True)
+                         for _ in range(n)]
+        for thread in self._threads:
+            thread.start()
+
+    def _on_mouse(self):
+        """Scrolls the content with the mouse wheel."""
+        try:
+            _, _, _, _, bstate = curses.getmouse()
+        except curses.error:
+            return
+        if bstate & curses.BUTTON4_PRESSED:
+            self.__scroll_content_up()
+        elif bstate & curses.BUTTON5_PRESSED:
+            self.__scroll_content_down()
+
+    def _quit(self):
+        """Stops the event loop once the current batch of input is handled."""
+        self._running = False
+
     def run(self):
-        """Main event loop for handling user input and window updates."""
-        self.background_thread.start()
+        """
+        Main event loop for handling user input and window updates.
+
+        The loop sleeps until a producer posts content or the redraw interval passes,
+        then drains all pending input without blocking and redraws once if needed.
+        Keys are dispatched through _key_handlers.
+        """
+        interval = REDRAW_INTERVAL_MS / 1000
+        self._start_workers(self.num_workers)
+        self.stdscr.nodelay(True)
+        self._running = True
         try:
-            while True:
-                ch = uc.getch()
-                if ch == uc.KEY_MOUSE:
-                    _, _, _, _, bstate = uc.getmouse()
-                    if bstate & uc.BUTTON4_PRESSED:
-                        self.__scroll_content_up()
-                    elif bstate & uc.BUTTON5_PRESSED:
-                        self.__scroll_content_down()
-                elif ch in (ord('q'), ord('Q')):
-                    break
+            while self._running:
+                self._wake.wait(interval)
+                self._wake.clear()
+                ch = self.stdscr.getch()
+                while ch != -1 and self._running:
+                    handler = self._key_handlers.get(ch)
+                    if handler is not None:
+                        handler()
+                    ch = self.stdscr.getch()
+                if self._dirty and self._running:
+                    # Posts wake the loop at once; never redraw more often than the interval,
+                    # so lines posted meanwhile are folded into the same redraw.
+                    time.sleep(max(0.0, self._last_draw + interval - time.monotonic()))
+                    self.__update_content_window()
         finally:
-            uc.endwin()
+            curses.endwin()
 
 
 if __name__ == '__main__':